@@ -0,0 +1,4 @@
+"""Бенчмарки бота на синтетическом наборе данных курса.
+
+Запуск: python -m bench.run --scales 10x20,50x50 --output bench.json
+"""
@@ -0,0 +1,85 @@
+"""Синтетический набор данных курса: чаты, участники, отчёты за каждый день и штрафы."""
+import random
+from datetime import datetime, timedelta
+
+import pytz
+
+import botb123 as bot_module
+from bench.fakes import chat_ids, user_id
+
+INSERT_CHUNK = 10000
+
+# Вероятности сдачи отчётов и штрафа за пропуск
+RECORD_PROBABILITY = 0.97
+MORNING_PROBABILITY = 0.9
+EVENING_PROBABILITY = 0.85
+WEEK_PROBABILITY = 0.8
+FINE_PROBABILITY = 0.3
+
+
+def course_today():
+    return datetime.now(pytz.timezone(bot_module.DEFAULT_TIMEZONE)).date()
+
+
+def reset_database():
+    """Пересоздаёт все таблицы бота по актуальной схеме. Только для отдельной базы бенчмарка!"""
+    bot_module.Base.metadata.drop_all(bot_module.engine)
+    bot_module.Base.metadata.create_all(bot_module.engine)
+    with bot_module.engine.begin() as connection:
+        bot_module.stamp_migrations(connection)
+
+
+def _insert(connection, model, rows):
+    for start in range(0, len(rows), INSERT_CHUNK):
+        connection.execute(model.__table__.insert(), rows[start:start + INSERT_CHUNK])
+
+
+def generate_dataset(chats, members, days=bot_module.COURSE_LENGTH_DAYS, seed=0, today=None):
+    """Заполняет пустую базу: chats чатов по members участников и days дней отчётов.
+
+    Сегодняшний день - последний день курса; его записи созданы пустыми, как после
+    смены дня, поэтому проверки дедлайнов находят опоздавших. Набор данных полностью определяется seed.
+    """
+    rng = random.Random(seed)
+    today = today or course_today()
+    start_date = today - timedelta(days=days - 1)
+
+    chat_rows, settings_rows, member_rows, record_rows, fine_rows = [], [], [], [], []
+    for chat_index, chat_id in enumerate(chat_ids(chats)):
+        chat_rows.append({'id': chat_id, 'start_date': start_date.isoformat(), 'data_version': 0})
+        settings_rows.append({'chat_id': chat_id, 'morning_hashtag': "#оу", 'evening_hashtag': "#ов",
+                              'week_hashtag': "#неделя", 'morning_deadline': "10:00",
+                              'evening_deadline': "23:59", 'timezone': bot_module.DEFAULT_TIMEZONE})
+        for member_index in range(members):
+            member_id = len(member_rows) + 1
+            member_user_id = user_id(chat_index, member_index, members)
+            member_rows.append({'id': member_id, 'chat_id': chat_id, 'user_id': member_user_id,
+                                'user_name': f"user{member_user_id}", 'full_name': f"Участник {member_user_id}",
+                                'data_version': 0})
+            for day in range(days - 1):
+                record_date = start_date + timedelta(days=day)
+                if rng.random() > RECORD_PROBABILITY:
+                    continue
+                flags = {
+                    'morning_hashtag': rng.random() < MORNING_PROBABILITY,
+                    'evening_hashtag': rng.random() < EVENING_PROBABILITY,
+                    'week_hashtag': record_date.weekday() == 6 and rng.random() < WEEK_PROBABILITY,
+                }
+                record_rows.append(dict(chat_member_id=member_id, date=record_date, **flags))
+                for report_type, flag in (('утренний', 'morning_hashtag'), ('вечерний', 'evening_hashtag')):
+                    if not flags[flag] and rng.random() < FINE_PROBABILITY:
+                        fine_rows.append({'chat_member_id': member_id, 'date_paid': record_date.isoformat(),
+                                          'report_type': report_type, 'fine_amount': 250})
+
+    with bot_module.engine.begin() as connection:
+        _insert(connection, bot_module.Chat, chat_rows)
+        _insert(connection, bot_module.Settings, settings_rows)
+        _insert(connection, bot_module.ChatMember, member_rows)
+        _insert(connection, bot_module.DailyRecord, record_rows)
+        _insert(connection, bot_module.Fine, fine_rows)
+    # Сводки участников строятся так же, как при миграции существующей базы
+    summaries = bot_module.rebuild_member_summaries()
+    preseeded = bot_module.preseed_daily_records(today, chat_ids(chats))
+
+    return {'chats': len(chat_rows), 'members': len(member_rows),
+            'daily_records': len(record_rows) + preseeded, 'fines': len(fine_rows), 'member_summaries': summaries}
@@ -0,0 +1,81 @@
+"""Заглушки Telegram-объектов: бот ничего не отправляет, только считает вызовы."""
+import threading
+
+
+# Идентификаторы синтетических чатов и участников, общие для набора данных и записанных апдейтов
+def chat_ids(chats):
+    return [-1000000000000 - chat_index for chat_index in range(chats)]
+
+
+def user_id(chat_index, member_index, members):
+    return 100000 + chat_index * members + member_index
+
+
+class FakeUser:
+    def __init__(self, user_id, username=None, first_name='Имя', last_name='Фамилия'):
+        self.id = user_id
+        self.username = username
+        self.first_name = first_name
+        self.last_name = last_name
+
+
+class FakeChatMember:
+    def __init__(self, user, status):
+        self.user = user
+        self.status = status
+
+
+class FakeMessage:
+    def __init__(self, chat_id, from_user, text=None, caption=None, message_id=1):
+        self.chat_id = chat_id
+        self.from_user = from_user
+        self.text = text
+        self.caption = caption
+        self.message_id = message_id
+
+
+class FakeUpdate:
+    def __init__(self, message=None, edited_message=None):
+        self.message = message
+        self.edited_message = edited_message
+
+
+class FakeContext:
+    def __init__(self, bot, args=None):
+        self.bot = bot
+        self.args = args or []
+
+
+class FakeBot:
+    """Бот без сети: администраторов в чатах нет, все сообщения считаются доставленными."""
+
+    id = 1
+
+    def __init__(self, admin_ids=()):
+        self.admin_ids = frozenset(admin_ids)
+        self.messages = 0
+        self.documents = 0
+        self.api_calls = 0
+        self._lock = threading.Lock()
+
+    def _call(self):
+        with self._lock:
+            self.api_calls += 1
+
+    def send_message(self, chat_id, text, **kwargs):
+        self._call()
+        with self._lock:
+            self.messages += 1
+
+    def send_document(self, chat_id, document, **kwargs):
+        self._call()
+        with self._lock:
+            self.documents += 1
+
+    def get_chat_administrators(self, chat_id):
+        self._call()
+        return [FakeChatMember(FakeUser(user_id), 'administrator') for user_id in self.admin_ids]
+
+    def get_chat_member(self, chat_id, user_id):
+        self._call()
+        return FakeChatMember(FakeUser(user_id), 'administrator' if user_id in self.admin_ids else 'member')
@@ -0,0 +1,129 @@
+"""Локальный стенд вебхука: отправляет записанные или синтетические апдейты на приёмник бота.
+
+    BOT_UPDATE_MODE=webhook BOT_WEBHOOK_RECORD=updates.jsonl python botb123.py   # запись апдейтов
+    python -m bench.replay --url http://127.0.0.1:8443/telegram updates.jsonl --concurrency 16
+    python -m bench.replay --url http://127.0.0.1:8443/telegram --generate 5000 --chats 50 --members 50
+
+Файл апдейтов - по одному JSON-апдейту Telegram в строке. Синтетические апдейты используют
+те же идентификаторы чатов и участников, что и bench.dataset, и хештеги с номером дня курса
+(--day, по умолчанию последний день, которым bench.dataset делает сегодняшний). Результат - JSON с пропускной
+способностью и p50/p95 времени HTTP-запроса.
+"""
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from bench.fakes import chat_ids, user_id
+
+# Как и в bench.run: бот засчитывает только хештеги с номером текущего дня (недели) курса
+REPORT_TEXTS = ("#оу{day} утренний отчёт", "#ов{day} вечерний отчёт", "#неделя{week} итоги недели",
+                "просто сообщение")
+# bench.dataset строит курс так, что сегодня - его последний день (COURSE_LENGTH_DAYS бота)
+DATASET_COURSE_DAY = 63
+
+
+def load_updates(path):
+    with open(path, 'rb') as updates_file:
+        return [line for line in (line.strip() for line in updates_file) if line]
+
+
+def generate_updates(count, chats, members, seed=0, day_number=DATASET_COURSE_DAY):
+    """Сообщения участников синтетического курса, в основном с отчётными хештегами дня day_number."""
+    rng = random.Random(seed)
+    texts = [text.format(day=day_number, week=(day_number - 1) // 7 + 1) for text in REPORT_TEXTS]
+    chat_id_list = chat_ids(chats)
+    now = int(time.time())
+    updates = []
+    for update_id in range(1, count + 1):
+        chat_index = rng.randrange(chats)
+        member_user_id = user_id(chat_index, rng.randrange(members), members)
+        updates.append(json.dumps({
+            'update_id': update_id,
+            'message': {
+                'message_id': update_id,
+                'date': now,
+                'chat': {'id': chat_id_list[chat_index], 'type': 'supergroup', 'title': f"Курс {chat_index}"},
+                'from': {'id': member_user_id, 'is_bot': False, 'first_name': "Участник",
+                         'username': f"user{member_user_id}"},
+                'text': rng.choice(texts),
+            },
+        }, ensure_ascii=False).encode('utf-8'))
+    return updates
+
+
+def _percentile(sorted_values, fraction):
+    return sorted_values[min(int(len(sorted_values) * fraction), len(sorted_values) - 1)]
+
+
+def replay(url, updates, concurrency, secret=None, timeout=10):
+    latencies = []
+    statuses = {}
+    lock = threading.Lock()
+    headers = {'Content-Type': 'application/json'}
+    if secret:
+        headers['X-Telegram-Bot-Api-Secret-Token'] = secret
+
+    def post(body):
+        started = perf_counter()
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, data=body, headers=headers),
+                                        timeout=timeout) as response:
+                status = response.status
+        except urllib.error.HTTPError as e:
+            status = e.code
+        except OSError as e:
+            status = type(e).__name__
+        elapsed = perf_counter() - started
+        with lock:
+            latencies.append(elapsed)
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+
+    started = perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(post, updates))
+    total = perf_counter() - started
+
+    latencies.sort()
+    return {
+        'updates': len(updates),
+        'concurrency': concurrency,
+        'seconds': round(total, 3),
+        'updates_per_second': round(len(updates) / total, 1) if total else 0.0,
+        'statuses': statuses,
+        'p50_ms': round(_percentile(latencies, 0.5) * 1000, 3) if latencies else 0.0,
+        'p95_ms': round(_percentile(latencies, 0.95) * 1000, 3) if latencies else 0.0,
+        'max_ms': round(latencies[-1] * 1000, 3) if latencies else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Воспроизведение апдейтов на вебхук бота")
+    parser.add_argument('updates', nargs='?', help="файл записанных апдейтов (JSON в каждой строке)")
+    parser.add_argument('--url', default='http://127.0.0.1:8443/telegram')
+    parser.add_argument('--secret', help="значение BOT_WEBHOOK_SECRET бота")
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--generate', type=int, default=0, help="сгенерировать столько апдейтов вместо файла")
+    parser.add_argument('--chats', type=int, default=10)
+    parser.add_argument('--members', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--day', type=int, default=DATASET_COURSE_DAY, help="день курса в хештегах отчётов")
+    args = parser.parse_args(argv)
+
+    if args.generate:
+        updates = generate_updates(args.generate, args.chats, args.members, args.seed, args.day)
+    elif args.updates:
+        updates = load_updates(args.updates)
+    else:
+        parser.error("укажите файл апдейтов или --generate")
+    print(json.dumps(replay(args.url, updates, args.concurrency, args.secret), ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
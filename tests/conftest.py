@@ -0,0 +1,48 @@
+"""Общие фикстуры тестов: модуль бота на временной базе SQLite."""
+import logging
+import os
+import sys
+import tempfile
+
+import pytest
+
+WORK_DIR = tempfile.mkdtemp(prefix='bottests_')
+# Адрес базы читается при импорте модуля бота, поэтому задаётся до импорта
+os.environ['BOT_DATABASE_URL'] = f"sqlite:///{os.path.join(WORK_DIR, 'test.db')}"
+# С обработчиком у корневого логгера basicConfig бота не создаёт myapp.log в каталоге запуска
+logging.getLogger().addHandler(logging.NullHandler())
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import botb123 as bot_module  # noqa: E402
+from bench import dataset  # noqa: E402
+
+
+@pytest.fixture
+def bot():
+    """Модуль бота с пустой базой по актуальной схеме и сброшенными кэшами."""
+    dataset.reset_database()
+    bot_module.chat_config_cache = bot_module.ChatConfigCache()
+    bot_module.roster_index = bot_module.RosterIndex()
+    bot_module.pending_submitters = bot_module.PendingSubmitters()
+    bot_module.REPORT_CACHE_DIR = os.path.join(WORK_DIR, 'report_cache')
+    return bot_module
+
+
+@pytest.fixture
+def add_members(bot):
+    """Создаёт чат и его участников (со строками сводок), возвращает id участников по порядку."""
+
+    def add(chat_id, user_ids, start_date='2026-10-01'):
+        session = bot.Session()
+        session.add(bot.Chat(id=chat_id, start_date=start_date))
+        members = [bot.ChatMember(chat_id=chat_id, user_id=user_id, user_name=f"user{user_id}",
+                                  full_name=f"Участник {user_id}") for user_id in user_ids]
+        session.add_all(members)
+        session.flush()
+        member_ids = [member.id for member in members]
+        session.add_all([bot.MemberSummary(chat_member_id=member_id) for member_id in member_ids])
+        session.commit()
+        session.close()
+        return member_ids
+
+    return add
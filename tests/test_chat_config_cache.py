@@ -0,0 +1,19 @@
+def test_chat_config_cache_drops_value_loaded_across_invalidation(bot, monkeypatch):
+    cache = bot.ChatConfigCache()
+    load_settings = bot._load_settings
+
+    def load_and_invalidate(chat_id):
+        settings = load_settings(chat_id)
+        cache.invalidate(chat_id)
+        return settings
+
+    monkeypatch.setattr(bot, '_load_settings', load_and_invalidate)
+    cache.get_settings(-1)
+    assert cache.stats()['misses'] == 1
+    cache.get_settings(-1)
+    assert cache.stats()['misses'] == 2
+
+    monkeypatch.setattr(bot, '_load_settings', load_settings)
+    cache.get_settings(-1)
+    cache.get_settings(-1)
+    assert cache.stats()['misses'] == 3
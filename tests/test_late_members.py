@@ -0,0 +1,53 @@
+from datetime import date, timedelta
+
+from sqlalchemy import event
+
+from bench.run import QueryCounter
+
+REPORT_DATE = date(2026, 10, 19)
+
+
+def test_find_late_members_flags_and_missing_records(bot, add_members):
+    no_record, empty_record, morning_only, both = add_members(-1, [100, 101, 102, 103])
+    other_chat_member, = add_members(-2, [200])
+    session = bot.Session()
+    session.add_all([
+        bot.DailyRecord(chat_member_id=empty_record, date=REPORT_DATE),
+        bot.DailyRecord(chat_member_id=morning_only, date=REPORT_DATE, morning_hashtag=True),
+        bot.DailyRecord(chat_member_id=both, date=REPORT_DATE, morning_hashtag=True, evening_hashtag=True),
+        # Отчёт за другой день не засчитывается
+        bot.DailyRecord(chat_member_id=no_record, date=REPORT_DATE - timedelta(days=1), morning_hashtag=True),
+    ])
+    session.commit()
+
+    late = bot.find_late_members(session, REPORT_DATE, ['morning', 'evening'])
+
+    assert [(member.member_id, member.has_record) for member in late[(-1, 'morning')]] == \
+        [(no_record, False), (empty_record, True)]
+    assert [member.member_id for member in late[(-1, 'evening')]] == [no_record, empty_record, morning_only]
+    assert [member.member_id for member in late[(-2, 'morning')]] == [other_chat_member]
+    assert set(bot.find_late_members(session, REPORT_DATE, ['morning'], chat_ids=[-2])) == {(-2, 'morning')}
+    session.close()
+
+
+def test_find_late_members_query_count_does_not_depend_on_member_count(bot, add_members):
+    counter = QueryCounter(bot.engine)
+    queries = []
+    try:
+        for chat_id, member_count in ((-1, 3), (-2, 60)):
+            member_ids = add_members(chat_id, range(abs(chat_id) * 1000, abs(chat_id) * 1000 + member_count))
+            session = bot.Session()
+            session.add_all([bot.DailyRecord(chat_member_id=member_id, date=REPORT_DATE, morning_hashtag=True)
+                             for member_id in member_ids[::2]])
+            session.commit()
+
+            counter.reset()
+            late = bot.find_late_members(session, REPORT_DATE, ['morning', 'evening', 'week'], chat_ids=[chat_id])
+            queries.append(counter.count)
+            session.close()
+            assert len(late[(chat_id, 'evening')]) == member_count
+    finally:
+        event.remove(bot.engine, 'before_cursor_execute', counter._on_execute)
+
+    # Число запросов не растёт с числом участников: всё выбирается одним запросом на вызов
+    assert queries[0] == queries[1] == 1
@@ -0,0 +1,19 @@
+from datetime import datetime, timedelta
+
+
+def test_leader_lease_expiry_and_takeover(bot):
+    first, second = bot.LeaderLease('first', ttl=30), bot.LeaderLease('second', ttl=30)
+
+    assert first.try_acquire()
+    assert not second.try_acquire()
+    assert first.try_acquire()
+
+    session = bot.Session()
+    session.query(bot.SchedulerLease).update({bot.SchedulerLease.expires_at: datetime.utcnow() - timedelta(seconds=1)})
+    session.commit()
+    session.close()
+    assert second.try_acquire()
+    assert not first.try_acquire()
+
+    second.release()
+    assert first.try_acquire()
@@ -0,0 +1,85 @@
+from datetime import date
+
+from sqlalchemy import inspect, text
+
+LEGACY_SCHEMA = """
+CREATE TABLE chats (id BIGINT PRIMARY KEY, start_date VARCHAR(255));
+CREATE TABLE members (id INTEGER PRIMARY KEY, chat_id BIGINT REFERENCES chats (id) ON DELETE CASCADE,
+                      user_id BIGINT NOT NULL, user_name VARCHAR(255), full_name VARCHAR(255));
+CREATE TABLE daily_records (id INTEGER PRIMARY KEY, chat_member_id INTEGER REFERENCES members (id) ON DELETE CASCADE,
+                            date VARCHAR(255), morning_hashtag VARCHAR(255), evening_hashtag VARCHAR(255),
+                            week_hashtag VARCHAR(255));
+CREATE INDEX ix_daily_records_member ON daily_records (chat_member_id);
+CREATE TABLE settings (id INTEGER PRIMARY KEY, chat_id BIGINT UNIQUE NOT NULL, morning_hashtag VARCHAR(255),
+                       evening_hashtag VARCHAR(255), week_hashtag VARCHAR(255), morning_deadline VARCHAR(255),
+                       evening_deadline VARCHAR(255), start_date VARCHAR(255));
+CREATE TABLE fines (id INTEGER PRIMARY KEY, chat_member_id INTEGER REFERENCES members (id),
+                    date_paid VARCHAR(255), report_type VARCHAR(255), fine_amount INTEGER);
+"""
+
+LEGACY_ROWS = """
+INSERT INTO chats VALUES (-1, '2026-10-01');
+INSERT INTO members VALUES (1, -1, 10, 'a', 'Участник A'), (2, -1, 10, 'a', 'Участник A'), (3, -1, 11, 'b', 'Участник B');
+INSERT INTO daily_records VALUES (1, 1, '2026-10-02', '1', 'False', NULL), (2, 2, '2026-10-02', '0', 'True', '0'),
+                                 (3, 3, '2026-10-03', 'True', '0', '0'), (4, 3, '2026-10-03', '0', '1', '0');
+INSERT INTO fines VALUES (1, 2, '2026-10-02', 'утренний', 250);
+"""
+
+
+def _create_legacy_database(bot):
+    bot.Base.metadata.drop_all(bot.engine)
+    with bot.engine.begin() as connection:
+        for statement in (LEGACY_SCHEMA + LEGACY_ROWS).split(';'):
+            if statement.strip():
+                connection.execute(text(statement))
+    # Как при импорте модуля: недостающие таблицы создаются, существующие не меняются
+    bot.Base.metadata.create_all(bot.engine)
+
+
+def test_migrations_upgrade_legacy_database(bot):
+    _create_legacy_database(bot)
+
+    applied = bot.run_migrations()
+
+    assert [version for version, _ in applied] == [version for version, _, _ in bot.MIGRATIONS]
+    assert bot.pending_migrations() == []
+    inspector = inspect(bot.engine)
+    column_types = {column['name']: type(column['type']).__name__ for column in inspector.get_columns('daily_records')}
+    assert column_types['date'] == 'DATE' and column_types['morning_hashtag'] == 'BOOLEAN'
+    assert bot._has_unique_index(inspector, 'members', ['chat_id', 'user_id'])
+    assert bot._has_unique_index(inspector, 'daily_records', ['chat_member_id', 'date'])
+    assert 'ix_daily_records_member' in {index['name'] for index in inspector.get_indexes('daily_records')}
+
+    session = bot.Session()
+    # Дубль участника слит в запись с наименьшим id вместе с отчётами и штрафами, флаги дублей объединены
+    assert [(member.id, member.user_id) for member in session.query(bot.ChatMember).order_by(bot.ChatMember.id)] == \
+        [(1, 10), (3, 11)]
+    records = [(record.chat_member_id, record.date, record.morning_hashtag, record.evening_hashtag,
+                record.week_hashtag) for record in session.query(bot.DailyRecord).order_by(bot.DailyRecord.id)]
+    assert records == [(1, date(2026, 10, 2), True, True, False), (3, date(2026, 10, 3), True, True, False)]
+    assert session.query(bot.Fine.chat_member_id).scalar() == 1
+    assert session.query(bot.MemberSummary).count() == 2
+    session.close()
+
+
+def test_migrations_are_idempotent(bot):
+    _create_legacy_database(bot)
+    bot.run_migrations()
+
+    with bot.engine.begin() as connection:
+        for _, _, migration in bot.MIGRATIONS:
+            migration(connection)
+    assert bot.run_migrations() == []
+
+
+def test_fresh_database_is_stamped(bot):
+    assert bot.pending_migrations() == []
+
+
+def test_concurrent_stamping_of_fresh_database_is_not_an_error(bot):
+    # Фикстура уже пометила базу, как будто это успел сделать другой процесс
+    bot.stamp_fresh_database()
+
+    assert bot.pending_migrations() == []
+    with bot.engine.connect() as connection:
+        assert connection.execute(text("SELECT COUNT(*) FROM schema_version")).scalar() == len(bot.MIGRATIONS)
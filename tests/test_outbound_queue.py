@@ -0,0 +1,49 @@
+from telegram.error import RetryAfter
+
+
+def _mention(user_id):
+    return f"<a href='tg://user?id={user_id}'>Участник, номер {user_id}</a>"
+
+
+def test_split_message_cuts_only_between_mentions(bot):
+    mentions = [_mention(user_id) for user_id in range(300)]
+    text = "Не отправили отчёт: " + ", ".join(mentions) + "."
+
+    chunks = bot.split_message(text, limit=500)
+
+    assert len(chunks) > 1 and all(len(chunk) <= 500 for chunk in chunks)
+    for chunk in chunks:
+        assert chunk.count("<a ") == chunk.count("</a>")
+    assert ", ".join(chunks) == text
+
+
+def test_split_message_hard_cut_does_not_enter_link(bot):
+    text = "x" * 60 + _mention(1)
+
+    chunks = bot.split_message(text, limit=70)
+
+    assert chunks == ["x" * 60, _mention(1)]
+
+
+class ThrottledOnceBot:
+    def __init__(self):
+        self.sent = []
+        self.throttled = False
+
+    def send_message(self, chat_id, text, **kwargs):
+        if not self.throttled:
+            self.throttled = True
+            raise RetryAfter(0)
+        self.sent.append(text)
+
+
+def test_requeued_chunk_keeps_its_place(bot):
+    outbound = bot.OutboundQueue(global_rate=100, chat_rate=100, chat_burst=10, workers=1)
+    telegram_bot = ThrottledOnceBot()
+    first, second = "а" * 4000, "б" * 4000
+
+    outbound.put(telegram_bot, -1, f"{first} {second}")
+    outbound.drain(timeout=5)
+
+    assert telegram_bot.sent == [first, second]
+    assert outbound.stats()['retried'] == 1
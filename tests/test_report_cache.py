@@ -0,0 +1,21 @@
+from openpyxl import load_workbook
+
+
+def _fine_rows(report):
+    member_sheet = load_workbook(report).worksheets[1]
+    return [row[5:7] for row in member_sheet.iter_rows(min_row=2, values_only=True) if row[4] == "Штраф"]
+
+
+def test_edited_fine_invalidates_cached_report(bot, add_members):
+    member_id, = add_members(-1, [100])
+    session = bot.Session()
+    session.add(bot.Fine(chat_member_id=member_id, date_paid='2026-10-18', report_type='утренний', fine_amount=250))
+    session.commit()
+    assert _fine_rows(bot.create_excel_file(-1)) == [('2026-10-18', 'утренний')]
+
+    # Штрафы правит внешний процесс: версии данных участника и чата не меняются
+    session.query(bot.Fine).update({bot.Fine.report_type: 'вечерний'})
+    session.commit()
+    session.close()
+
+    assert _fine_rows(bot.create_excel_file(-1)) == [('2026-10-18', 'вечерний')]
@@ -0,0 +1,43 @@
+from datetime import date
+
+
+def test_add_member_registers_new_member(bot, add_members):
+    add_members(-1, [])
+
+    assert bot.add_member_to_chat(-1, 100, 'user100', 'Имя', 'Фамилия') == 'Вы успешно добавлены в список участников!'
+    assert bot.add_member_to_chat(-1, 100, 'user100', 'Имя', 'Фамилия') == 'Вы уже зарегистрированы.'
+
+    session = bot.Session()
+    member = session.query(bot.ChatMember).filter_by(chat_id=-1, user_id=100).one()
+    assert session.query(bot.MemberSummary).filter_by(chat_member_id=member.id).count() == 1
+    session.close()
+    assert bot.roster_index.get(-1, 100).member_id == member.id
+
+
+def test_add_member_missing_from_stale_index_is_not_inserted_again(bot, add_members):
+    bot.roster_index.load()
+    # Участника добавил другой процесс: в БД он есть, а в индексе этого процесса - нет
+    member_id, = add_members(-1, [100])
+
+    assert bot.add_member_to_chat(-1, 100, 'user100', 'Новое', 'Имя') == 'Вы уже зарегистрированы.'
+
+    session = bot.Session()
+    member = session.query(bot.ChatMember).filter_by(chat_id=-1, user_id=100).one()
+    assert (member.id, member.full_name) == (member_id, 'Новое Имя')
+    session.close()
+    assert bot.roster_index.get(-1, 100).full_name == 'Новое Имя'
+
+
+def test_remove_member_deletes_dependent_rows(bot, add_members):
+    removed, kept = add_members(-1, [100, 101])
+    session = bot.Session()
+    session.add_all([bot.DailyRecord(chat_member_id=member_id, date=date(2026, 10, 19), morning_hashtag=True)
+                     for member_id in (removed, kept)])
+    session.commit()
+
+    bot.remove_member_from_chat(-1, 100)
+
+    assert [member.id for member in session.query(bot.ChatMember)] == [kept]
+    assert [record.chat_member_id for record in session.query(bot.DailyRecord)] == [kept]
+    assert [summary.chat_member_id for summary in session.query(bot.MemberSummary)] == [kept]
+    session.close()
@@ -0,0 +1,47 @@
+from datetime import date
+
+REPORT_DATE = date(2026, 10, 19)
+
+
+def test_flush_daily_records_updates_inserts_and_counts_submissions(bot, add_members):
+    with_record, without_record = add_members(-1, [100, 101])
+    session = bot.Session()
+    session.add(bot.DailyRecord(chat_member_id=with_record, date=REPORT_DATE))
+    session.commit()
+    session.close()
+    pending = {
+        (-1, 100, REPORT_DATE): {'morning_hashtag': True},
+        (-1, 101, REPORT_DATE): {'evening_hashtag': True, 'week_hashtag': False},
+        # Незарегистрированный участник пропускается
+        (-1, 999, REPORT_DATE): {'morning_hashtag': True},
+    }
+
+    bot.flush_daily_records(pending)
+    bot.flush_daily_records(pending)
+
+    session = bot.Session()
+    records = {record.chat_member_id: (record.morning_hashtag, record.evening_hashtag, record.week_hashtag)
+               for record in session.query(bot.DailyRecord)}
+    assert records == {with_record: (True, False, False), without_record: (False, True, False)}
+    summaries = {summary.chat_member_id: summary for summary in session.query(bot.MemberSummary)}
+    # Повторный сброс тех же отметок не засчитывает сдачу второй раз
+    assert (summaries[with_record].morning_submitted, summaries[with_record].evening_submitted) == (1, 0)
+    assert (summaries[without_record].morning_submitted, summaries[without_record].evening_submitted) == (0, 1)
+    assert summaries[without_record].last_submission == REPORT_DATE
+    session.close()
+
+
+def test_daily_record_buffer_merges_marks(bot, add_members):
+    member_id, = add_members(-1, [100])
+    buffer = bot.DailyRecordBuffer(max_pending=10)
+    buffer.add(-1, 100, REPORT_DATE, {'morning_hashtag': True})
+    buffer.add(-1, 100, REPORT_DATE, {'evening_hashtag': True})
+
+    assert buffer.stats()['pending'] == 1
+    buffer.flush()
+
+    session = bot.Session()
+    record = session.query(bot.DailyRecord).filter_by(chat_member_id=member_id).one()
+    assert (record.morning_hashtag, record.evening_hashtag) == (True, True)
+    session.close()
+    assert buffer.stats() == {'pending': 0, 'flushes': 1, 'flushed_records': 1}